@@ -1,10 +1,52 @@
-import uuid
+import os
 import time
 import random
 import logging
 import math
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Final, List, Optional
+
+from _falcon_kernels import (
+    INV_MAX_ALT,
+    INV_SPEED_NORM,
+    MAX_ALT,
+    SAFE_ALT,
+    SPAN_ALT,
+    SPAN_DRAIN,
+    SPAN_DUST,
+    SPAN_SPEED,
+    SPAN_WIND,
+)
+from _falcon_kernels import env_recurrence as _py_env_recurrence
+from _falcon_kernels import step as _py_step
+
+
+try:
+    import numpy as np
+except ImportError:  # only the batch API needs NumPy
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    from falcon_c import run_sim as _run_sim_aot
+except ImportError:  # built by build_falcon.py; optional
+    _run_sim_aot = None
+
+try:
+    import _falcon_core
+except ImportError:  # compiled kernels are optional, see _falcon_core.pyx
+    _falcon_core = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -13,9 +55,99 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_RAND_BLOCK_SIZE: Final = 2048
+
+STATUS_GREEN: Final = 0
+STATUS_YELLOW: Final = 1
+STATUS_RED: Final = 2
+# Indexed by sensor code.
+_STATUS_TABLE: Final = ("GREEN", "YELLOW", "RED")
+
+
+if _run_sim_aot is not None:
+    _env_recurrence = _run_sim_aot
+else:
+    _env_recurrence = njit(cache=True)(_py_env_recurrence)
+
+
+if _falcon_core is not None:
+    _step = _falcon_core.step
+else:
+    _step = njit(cache=True)(_py_step)
+
+
+@dataclass(slots=True)
+class Telemetry:
+    x: float
+    y: float
+    battery: float
+    gx: float
+    gy: float
+    gz: float
+    wind: float
+    dust: float
+    status: int
+
+
+# Shared constant_runner commands; callers must not mutate them.
+_CR_INITIAL = {"altitude": 5.0, "speed": 4.0, "movement": "fwd"}
+_CR_ODD = {"altitude": -1.0, "speed": 4.0, "movement": "fwd"}
+_CR_EVEN = {"altitude": 1.0, "speed": 4.0, "movement": "fwd"}
+
+
+def _random_pool(rng: "np.random.Generator") -> "np.ndarray":
+    # One block of uniform [0, 1) draws, consumed in order by _random_draws.
+    return rng.random(_RAND_BLOCK_SIZE, dtype=np.float32)
+
+
+@lru_cache(maxsize=256)
+def _decide(status: int, batt_bucket: int, cooldown: bool, trend: bool) -> tuple:
+    # Deterministic part of send_command's threshold chain. The battery bucket
+    # is 0 below 20%, 1 below 50% and 2 otherwise. Returns (speed cap,
+    # altitude mode, info messages) with altitude mode one of "random",
+    # "safe_delta" or "force_land"; the random draws, the altitude cap, which
+    # depends on the exact current altitude, and the RED cooldown message,
+    # which carries the remaining count, are handled by the caller.
+    messages = []
+    if status == STATUS_RED:
+        messages.append("Sensor status RED: Forcing landing")
+    elif status == STATUS_YELLOW:
+        messages.append("Sensor status YELLOW: Reducing altitude and speed")
+    if trend:
+        messages.append("High environmental trend detected: Reducing speed and altitude")
+    if batt_bucket < 2:
+        messages.append("Low battery (<50%): Entering power-saving mode")
+    if batt_bucket == 0:
+        messages.append("Critical battery (<20%): Forcing landing")
+
+    if status == STATUS_RED or batt_bucket == 0:
+        return 0.0, "force_land", tuple(messages)
+    if status == STATUS_YELLOW or cooldown or trend or batt_bucket == 1:
+        return 3.0, "safe_delta", tuple(messages)
+    return math.inf, "random", tuple(messages)
+
+
+def _run_single_trial(seed: int, cfg: Dict[str, any]) -> Dict[str, float]:
+    # Per-iteration INFO logging dominates an unpaced trial, so only warnings
+    # and errors are kept while it runs.
+    level = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        drone = DroneClient(seed=seed, **cfg)
+        return drone.run()
+    finally:
+        logger.setLevel(level)
+
+
 class DroneClient:
-    def __init__(self, max_iterations: int = 100, use_constant_runner: bool = True):
-        self.connection_id = str(uuid.uuid4())
+    def __init__(
+        self,
+        max_iterations: int = 100,
+        use_constant_runner: bool = True,
+        sim_rate_hz: Optional[float] = 20.0,
+        seed: Optional[int] = None,
+    ):
+        self.connection_id = os.urandom(16).hex()
         self.x_position = 0.0
         self.y_position = 0.0
         self.battery = 100.0
@@ -23,27 +155,60 @@ class DroneClient:
         self.total_distance = 0.0
         self.start_time = time.time()
         self.red_cooldown = 0
-        self.previous_status = "GREEN"
+        self.previous_status = STATUS_GREEN
         self.previous_dust = 0.0
         self.previous_wind = 0.0
         self.max_iterations = max_iterations
-        self.max_altitude = 8.0
-        self.safe_altitude = 2.0  
+        self.max_altitude = MAX_ALT
+        self.safe_altitude = SAFE_ALT
         self.use_constant_runner = use_constant_runner
-        self.telemetry_history = []  
+        # Control-loop rate in wall-clock ticks per second; None runs unpaced.
+        self.sim_rate_hz = sim_rate_hz
+        # Parity of the telemetry sample count, the only state constant_runner reads.
+        self._cr_parity = 0
+        self._cr_first = True
+        self._land_cmd = {"speed": 0.0, "altitude": 0.0, "movement": "fwd"}
+        # Exactly one generator per client: NumPy's when available, otherwise
+        # random.Random. A seed therefore reproduces a run only on installs
+        # that agree on whether NumPy is present.
+        if np is not None:
+            self._np_rng = np.random.default_rng(seed)
+            # Fixed-size block of draws; _rand_pos is the next unused one.
+            self._rand = _random_pool(self._np_rng)
+            self._rand_pos = 0
+        else:
+            # Without NumPy, draws are taken on demand from random.Random.
+            self._np_rng = None
+            self._rand = None
+            self._r = random.Random(seed).random
 
-    def constant_runner(self, telemetry: List[Dict]) -> Dict[str, float]:
-        initial = {"altitude": 5.0, "speed": 4.0, "movement": "fwd"}
-        nextodd = {"altitude": -1.0, "speed": 4.0, "movement": "fwd"} 
-        nexteven = {"altitude": 1.0, "speed": 4.0, "movement": "fwd"}  
+    def _random_draws(self, k: int) -> List[float]:
+        # Every call consumes k fresh draws, so repeated calls never reuse them.
+        if self._rand is None:
+            r = self._r
+            return [r() for _ in range(k)]
+        i = self._rand_pos
+        if i + k > _RAND_BLOCK_SIZE:
+            self._rand = _random_pool(self._np_rng)
+            i = 0
+        self._rand_pos = i + k
+        return self._rand[i:i + k].tolist()
 
-        if len(telemetry) == 0:
-            return initial
-        return nextodd if len(telemetry) % 2 != 0 else nexteven
+    def _force_land(self) -> Dict[str, any]:
+        # Reuses one dict for every landing command; callers must not mutate
+        # it, and it is only valid until the next _force_land() call.
+        self._land_cmd["altitude"] = -self.y_position
+        return self._land_cmd
 
-    def generate_telemetry(self, command: Dict[str, float]) -> Dict[str, any]:
+    def constant_runner(self) -> Dict[str, float]:
+        # Returns shared commands that callers must not mutate: the initial one
+        # before any telemetry, then alternating by the parity of the sample count.
+        if self._cr_first:
+            return _CR_INITIAL
+        return _CR_ODD if self._cr_parity else _CR_EVEN
+
+    def generate_telemetry(self, command: Dict[str, float]) -> Telemetry:
         try:
-            self.iterations += 1
             speed = command.get("speed", 0.0)
             altitude = command.get("altitude", 0.0)
             movement = command.get("movement", "fwd")
@@ -54,95 +219,130 @@ class DroneClient:
             if not isinstance(altitude, (int, float)):
                 logger.error(f"Invalid altitude: {altitude}")
                 altitude = 0.0
+            return self._generate_telemetry_fast(float(speed), float(altitude), movement)
+        except Exception as e:
+            logger.error(f"Error generating telemetry: {str(e)}")
+            return Telemetry(
+                self.x_position, self.y_position, self.battery, 0.0, 0.0, 0.0, 0.0, 0.0, STATUS_RED
+            )
 
-            if movement == "fwd" and speed > 0:
-                self.x_position += speed
-                self.total_distance += speed
-            self.y_position = min(max(self.y_position + altitude, 0.0), self.max_altitude)
-            logger.debug(f"Updated position: x={self.x_position}, y={self.y_position}")
+    def _generate_telemetry_fast(self, speed: float, altitude: float, movement: str) -> Telemetry:
+        # Assumes validated float inputs; generate_telemetry is the checked entry point.
+        self.iterations += 1
+        r = self._random_draws(6)
 
-            battery_drain = 1.5 * (
-                1.0 * speed / 5.0 + 0.5 * self.y_position / 8.0 + random.uniform(0.1, 0.5)
-            )
-            self.battery = max(0.0, self.battery - battery_drain)
-
-            wind_speed = min(
-                100.0,
-                max(
-                    40.0,  
-                    self.previous_wind
-                    + random.uniform(-20.0, 20.0) * (1.0 + speed / 5.0),
-                ),
-            )
-            dust_level = min(
-                100.0,
-                max(
-                    40.0,
-                    self.previous_dust
-                    + random.uniform(-30.0, 30.0) * (1.0 + wind_speed / 50.0),
-                ),
-            )
+        if movement == "fwd" and speed > 0:
+            self.x_position += speed
+            self.total_distance += speed
+        (
+            self.y_position,
+            self.battery,
+            wind_speed,
+            dust_level,
+            sensor_code,
+        ) = _step(
+            self.y_position,
+            self.battery,
+            self.previous_wind,
+            self.previous_dust,
+            speed,
+            altitude,
+            self.max_altitude,
+            r[0],
+            r[1],
+            r[2],
+        )
+        logger.debug("Updated position: x=%s, y=%s", self.x_position, self.y_position)
 
-   
-            sensor_status = "GREEN"
-            if dust_level > 80 or wind_speed > 80:
-                sensor_status = "RED"
-            elif dust_level > 60 or wind_speed > 60:
-                sensor_status = "YELLOW"
-
-
-            gyroscope = [
-                random.uniform(-0.5, 0.5),
-                random.uniform(-0.5, 0.5),
-                random.uniform(-0.5, 0.5),
-            ]
-
-            telemetry = {
-                "x_position": self.x_position,
-                "y_position": self.y_position,
-                "battery": self.battery,
-                "gyroscope": gyroscope,
-                "wind_speed": wind_speed,
-                "dust_level": dust_level,
-                "sensor_status": sensor_status,
-            }
-            self.telemetry_history.append(telemetry)
-            logger.debug(f"Generated telemetry: {telemetry}")
-            return telemetry
-        except Exception as e:
-            logger.error(f"Error generating telemetry: {str(e)}")
-            return {
-                "x_position": self.x_position,
-                "y_position": self.y_position,
-                "battery": self.battery,
-                "gyroscope": [0.0, 0.0, 0.0],
-                "wind_speed": 0.0,
-                "dust_level": 0.0,
-                "sensor_status": "RED",
-            }
-
-    def predict_crash(self, command: Dict[str, float], telemetry: Dict[str, any]) -> bool:
+        telemetry = Telemetry(
+            self.x_position,
+            self.y_position,
+            self.battery,
+            r[3] - 0.5,
+            r[4] - 0.5,
+            r[5] - 0.5,
+            wind_speed,
+            dust_level,
+            sensor_code,
+        )
+        self._cr_parity ^= 1
+        self._cr_first = False
+        logger.debug("Generated telemetry: %s", telemetry)
+        return telemetry
+
+    def generate_telemetry_batch(self, commands: "np.ndarray") -> Dict[str, "np.ndarray"]:
+        if np is None:
+            raise ImportError("generate_telemetry_batch requires numpy")
+        commands = np.asarray(commands, dtype=np.float64)
+        n = commands.shape[0]
+        rng = self._np_rng
+        speed = np.maximum(commands[:, 0], 0.0)
+        altitude = commands[:, 1]
+
+        args = (
+            self.y_position,
+            self.previous_wind,
+            self.previous_dust,
+            speed,
+            altitude,
+            self.max_altitude,
+            rng.random(n) * SPAN_WIND - 20.0,
+            rng.random(n) * SPAN_DUST - 30.0,
+        )
+        trajectory = _env_recurrence(*args)
+        y, wind, dust = trajectory[:, 0], trajectory[:, 1], trajectory[:, 2]
+        x = self.x_position + np.cumsum(speed)
+        drain = 1.5 * (speed * INV_SPEED_NORM + 0.5 * y * INV_MAX_ALT + 0.1 + SPAN_DRAIN * rng.random(n))
+        battery = np.clip(self.battery - np.cumsum(drain), 0.0, 100.0)
+        gyroscope = rng.random((n, 3)) - 0.5
+        worst = np.maximum(dust, wind)
+        sensor_status = (worst > 60).astype(np.int8) + (worst > 80).astype(np.int8)
+
+        if n:
+            self.iterations += n
+            self._cr_parity ^= n & 1
+            self._cr_first = False
+            self.total_distance += float(x[-1] - self.x_position)
+            self.x_position = float(x[-1])
+            self.y_position = float(y[-1])
+            self.battery = float(battery[-1])
+            self.previous_wind = float(wind[-1])
+            self.previous_dust = float(dust[-1])
+        return {
+            "x_position": x,
+            "y_position": y,
+            "battery": battery,
+            "gyroscope": gyroscope,
+            "wind_speed": wind,
+            "dust_level": dust,
+            "sensor_status": sensor_status,
+        }
+
+    def predict_crash(self, command: Dict[str, float], telemetry: Telemetry) -> bool:
         try:
             speed = command.get("speed", 0.0)
             altitude = command.get("altitude", 0.0)
-            sensor_status = telemetry.get("sensor_status", "GREEN")
-            battery = telemetry.get("battery", 0.0)
-            predicted_y_position = min(max(self.y_position + altitude, 0.0), self.max_altitude)
-
-            if (
-                predicted_y_position > self.safe_altitude
-                and (
-                    sensor_status == "RED"
-                    or self.previous_status == "RED"
-                    or self.red_cooldown > 0
-                )
+            battery = telemetry.battery
+            max_alt = self.max_altitude
+            predicted_y_position = self.y_position + altitude
+            if predicted_y_position > max_alt:
+                predicted_y_position = max_alt
+            elif predicted_y_position < 0.0:
+                predicted_y_position = 0.0
+
+            if predicted_y_position > self.safe_altitude and (
+                telemetry.status == STATUS_RED
+                or self.previous_status == STATUS_RED
+                or self.red_cooldown > 0
             ):
                 logger.warning("Crash predicted: Unsafe altitude with RED status")
                 return True
-            if predicted_y_position > self.max_altitude:
-                logger.warning(f"Crash predicted: Altitude {predicted_y_position} exceeds max {self.max_altitude}")
+            if predicted_y_position > max_alt:
+                logger.warning(
+                    "Crash predicted: Altitude %s exceeds max %s", predicted_y_position, max_alt
+                )
                 return True
-            if battery < 15 and speed > 0:  
+            if battery < 15 and speed > 0:
                 logger.warning("Crash predicted: Low battery with movement")
                 return True
             return False
@@ -150,104 +350,148 @@ class DroneClient:
             logger.error(f"Error predicting crash: {str(e)}")
             return True
 
-    def send_command(self, telemetry: Dict[str, any]) -> Dict[str, any]:
+    def send_command(self, telemetry: Telemetry) -> Dict[str, any]:
+        # Landing commands come from the dict shared by _force_land, so hand
+        # callers their own copy; run() calls _send_command directly.
+        return dict(self._send_command(telemetry))
+
+    def _send_command(self, telemetry: Telemetry) -> Dict[str, any]:
         try:
-            command = {
-                "speed": random.uniform(3.0, 7.0),
-                "altitude": random.uniform(-2.0, 2.0),
-                "movement": "fwd"
-            }
-            dust_trend = telemetry["dust_level"] - self.previous_dust
-            wind_trend = telemetry["wind_speed"] - self.previous_wind
-            logger.info(f"Environmental trends: dust_trend={dust_trend:.2f}, wind_trend={wind_trend:.2f}")
-            if telemetry["sensor_status"] == "RED":
-                command = {"speed": 0.0, "altitude": -self.y_position, "movement": "fwd"}
-                self.red_cooldown = 5  
-                logger.info("Sensor status RED: Forcing landing")
-            elif telemetry["sensor_status"] == "YELLOW":
-                command["speed"] = 3.0
-                command["altitude"] = min(command["altitude"], self.safe_altitude - self.y_position)
-                self.red_cooldown = max(0, self.red_cooldown - 1)
-                logger.info("Sensor status YELLOW: Reducing altitude and speed")
-            elif self.red_cooldown > 0:
-                command["speed"] = 3.0
-                command["altitude"] = min(command["altitude"], self.safe_altitude - self.y_position)
-                logger.info(f"RED cooldown active ({self.red_cooldown} iterations remaining)")
-                self.red_cooldown -= 1
+            r = self._random_draws(2)
+            y = self.y_position
+            battery = telemetry.battery
+            cooldown = self.red_cooldown
+            dust_trend = telemetry.dust - self.previous_dust
+            wind_trend = telemetry.wind - self.previous_wind
+            logger.info("Environmental trends: dust_trend=%.2f, wind_trend=%.2f", dust_trend, wind_trend)
+
+            speed_cap, altitude_mode, messages = _decide(
+                telemetry.status,
+                0 if battery < 20 else 1 if battery < 50 else 2,
+                cooldown > 0,
+                dust_trend > 10 or wind_trend > 10,
+            )
+            if cooldown > 0 and telemetry.status == STATUS_GREEN:
+                logger.info("RED cooldown active (%d iterations remaining)", cooldown)
+            for message in messages:
+                logger.info(message)
+            self.red_cooldown = 5 if telemetry.status == STATUS_RED else max(0, cooldown - 1)
+
+            if altitude_mode == "force_land":
+                command = self._force_land()
             else:
-                command["altitude"] = random.uniform(-2.0, 2.0)
-            if dust_trend > 10 or wind_trend > 10:
-                command["speed"] = min(command["speed"], 3.0)
-                command["altitude"] = min(command["altitude"], self.safe_altitude - self.y_position)
-                logger.info("High environmental trend detected: Reducing speed and altitude")
-            if telemetry["battery"] < 50:
-                command["speed"] = min(command["speed"], 3.0)
-                command["altitude"] = min(command["altitude"], 2.0 - self.y_position)
-                logger.info("Low battery (<50%): Entering power-saving mode")
-            if telemetry["battery"] < 20:
-                command = {"speed": 0.0, "altitude": -self.y_position, "movement": "fwd"}
-                logger.info("Critical battery (<20%): Forcing landing")
+                altitude = SPAN_ALT * r[1] - 2.0
+                if altitude_mode == "safe_delta":
+                    altitude = min(altitude, self.safe_altitude - y)
+                command = {
+                    "speed": min(3.0 + SPAN_SPEED * r[0], speed_cap),
+                    "altitude": altitude,
+                    "movement": "fwd",
+                }
             if self.predict_crash(command, telemetry):
                 logger.warning("Crash predicted: Forcing safe command")
-                command = {"speed": 0.0, "altitude": -self.y_position, "movement": "fwd"}
-            self.previous_status = telemetry["sensor_status"]
-            self.previous_dust = telemetry["dust_level"]
-            self.previous_wind = telemetry["wind_speed"]
+                command = self._force_land()
+            self.previous_status = telemetry.status
+            self.previous_dust = telemetry.dust
+            self.previous_wind = telemetry.wind
 
-            logger.info(f"Sending command: {command}")
+            logger.info("Sending command: %s", command)
             return command
         except Exception as e:
             logger.error(f"Error sending command: {str(e)}")
-            return {"speed": 0.0, "altitude": -self.y_position, "movement": "fwd"}
+            return self._force_land()
 
     def run(self):
         logger.info(f"Connected with ID: {self.connection_id}")
         command = {"speed": 5.0, "altitude": 0.0, "movement": "fwd"}
         logger.info(f"Sending initial command: {command}")
 
-        while self.battery > 0 and self.iterations < self.max_iterations:
-            time.sleep(0.05)
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        log_info = logger.info
+        generate_telemetry = self._generate_telemetry_fast
+        predict_crash = self.predict_crash
+        constant_runner = self.constant_runner
+        send_command = self._send_command
+        use_constant_runner = self.use_constant_runner
+        safe_altitude = self.safe_altitude
+        battery, iters, max_iter = self.battery, self.iterations, self.max_iterations
+        dt = 1.0 / self.sim_rate_hz if self.sim_rate_hz else 0.0
+        next_tick = time.monotonic()
+        while battery > 0 and iters < max_iter:
+            if dt > 0:
+                next_tick += dt
+                slack = next_tick - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
             try:
-                telemetry = self.generate_telemetry(command)
-                metrics = {"iterations": self.iterations, "total_distance": self.total_distance}
-                logger.info(f"Telemetry: {telemetry}, Metrics: {metrics}")
+                telemetry = generate_telemetry(
+                    command["speed"], command["altitude"], command["movement"]
+                )
+                battery, iters = telemetry.battery, self.iterations
+                if info_enabled:
+                    log_info(
+                        "Telemetry: %s, Metrics: {'iterations': %d, 'total_distance': %s}",
+                        telemetry,
+                        iters,
+                        self.total_distance,
+                    )
                 if (
-                    telemetry["y_position"] > self.safe_altitude
+                    telemetry.y > safe_altitude
                     and (
-                        telemetry["sensor_status"] == "RED"
-                        or self.previous_status == "RED"
+                        telemetry.status == STATUS_RED
+                        or self.previous_status == STATUS_RED
                     )
                 ):
-                    crash_message = (
-                        f"Drone has crashed due to unsafe altitude with RED sensor status. "
-                        f"Maximum safe altitude is {self.safe_altitude}. Final telemetry: "
-                        f"X-{telemetry['x_position']}-Y-{telemetry['y_position']}-"
-                        f"BAT-{telemetry['battery']}-GYR-{telemetry['gyroscope']}-"
-                        f"WIND-{telemetry['wind_speed']}-DUST-{telemetry['dust_level']}-"
-                        f"SENS-{telemetry['sensor_status']}"
-                    )
                     logger.error(
-                        f"Drone crashed: {{'status': 'crashed', 'message': '{crash_message}', "
-                        f"'metrics': {metrics}, 'connection_terminated': True}}"
+                        "Drone crashed: status=crashed reason=unsafe altitude with RED sensor status "
+                        "safe_alt=%.2f x=%.2f y=%.2f bat=%.2f gyr=[%.3f, %.3f, %.3f] wind=%.2f "
+                        "dust=%.2f sens=%s iters=%d dist=%.2f connection_terminated=True",
+                        safe_altitude,
+                        telemetry.x,
+                        telemetry.y,
+                        telemetry.battery,
+                        telemetry.gx,
+                        telemetry.gy,
+                        telemetry.gz,
+                        telemetry.wind,
+                        telemetry.dust,
+                        _STATUS_TABLE[telemetry.status],
+                        iters,
+                        self.total_distance,
                     )
                     break
-                if self.use_constant_runner:
-                    command = self.constant_runner(self.telemetry_history)
-                    if self.predict_crash(command, telemetry):
+                if use_constant_runner:
+                    command = constant_runner()
+                    if predict_crash(command, telemetry):
                         logger.warning("Crash predicted: Forcing safe command")
-                        command = {"speed": 0.0, "altitude": -self.y_position, "movement": "fwd"}
-                    logger.info(f"constantRunner command: {command}")
+                        command = self._force_land()
+                    log_info("constantRunner command: %s", command)
                 else:
-                    command = self.send_command(telemetry)
+                    command = send_command(telemetry)
 
             except Exception as e:
                 logger.error(f"Error in control loop: {str(e)}")
                 break
         flight_duration = time.time() - self.start_time
+        metrics = {"iterations": self.iterations, "total_distance": self.total_distance}
         logger.info(f"Final metrics: {metrics}")
         logger.info(f"Commands sent: {self.iterations}")
         logger.info(f"Flight duration: {flight_duration:.2f}s")
         logger.info(f"Maximum distance traveled: {self.total_distance:.2f} units")
+        return metrics
+
+    @classmethod
+    def run_many(cls, n_trials: int, workers: Optional[int] = None, **cfg) -> List[Dict[str, float]]:
+        # Trials share no state, so each one runs in its own process, seeded
+        # by its index. Trials run unpaced unless sim_rate_hz is given.
+        cfg.setdefault("sim_rate_hz", None)
+        seeds = range(n_trials)
+        if workers == 1:
+            return [_run_single_trial(seed, cfg) for seed in seeds]
+        workers = workers or os.cpu_count()
+        chunksize = max(1, n_trials // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(_run_single_trial, seeds, itertools.repeat(cfg), chunksize=chunksize))
 
 if __name__ == "__main__":
     drone = DroneClient(max_iterations=100, use_constant_runner=True)
@@ -0,0 +1,45 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+#
+# Compiled version of _falcon_kernels.step, which Falcon.py uses in place of
+# the pure-Python/Numba kernel when this module is importable. Keep the math in
+# step() in line with _falcon_kernels.step; the constants are read from that
+# module at import time. Build in place with:
+#
+#     cythonize -i -3 _falcon_core.pyx
+
+from libc.math cimport fmax, fmin
+
+import _falcon_kernels
+
+cdef double INV_MAX_ALT = _falcon_kernels.INV_MAX_ALT
+cdef double INV_SPEED_NORM = _falcon_kernels.INV_SPEED_NORM
+cdef double INV_WIND_NORM = _falcon_kernels.INV_WIND_NORM
+cdef double SPAN_DRAIN = _falcon_kernels.SPAN_DRAIN
+cdef double SPAN_WIND = _falcon_kernels.SPAN_WIND
+cdef double SPAN_DUST = _falcon_kernels.SPAN_DUST
+
+
+cpdef tuple step(
+    double y,
+    double battery,
+    double prev_wind,
+    double prev_dust,
+    double speed,
+    double altitude,
+    double max_alt,
+    double r1,
+    double r2,
+    double r3,
+):
+    cdef double speed_norm = speed * INV_SPEED_NORM
+    cdef double wind, dust, worst
+    cdef int sensor_code
+
+    y = fmin(fmax(y + altitude, 0.0), max_alt)
+    battery = fmax(0.0, battery - 1.5 * (speed_norm + 0.5 * y * INV_MAX_ALT + 0.1 + SPAN_DRAIN * r1))
+    wind = fmin(100.0, fmax(40.0, prev_wind + (SPAN_WIND * r2 - 20.0) * (1.0 + speed_norm)))
+    dust = fmin(100.0, fmax(40.0, prev_dust + (SPAN_DUST * r3 - 30.0) * (1.0 + wind * INV_WIND_NORM)))
+    worst = fmax(dust, wind)
+    sensor_code = (worst > 60.0) + (worst > 80.0)
+    return y, battery, wind, dust, sensor_code
+
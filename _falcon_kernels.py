@@ -0,0 +1,59 @@
+# Numeric constants and per-iteration kernels shared by Falcon.py,
+# build_falcon.py and _falcon_core.pyx. Kept free of import-time side effects
+# (no logging setup, no optional extension imports) so the build scripts can
+# import it; Falcon.py applies Numba's njit to these functions itself.
+
+from typing import Final
+
+try:
+    import numpy as np
+except ImportError:  # only env_recurrence needs NumPy
+    np = None
+
+MAX_ALT: Final = 8.0
+SAFE_ALT: Final = 2.0
+INV_MAX_ALT: Final = 1.0 / 8.0
+INV_SPEED_NORM: Final = 1.0 / 5.0
+INV_WIND_NORM: Final = 1.0 / 50.0
+
+# Widths of the uniform ranges that per-iteration draws in [0, 1) are scaled to.
+SPAN_DRAIN: Final = 0.4
+SPAN_WIND: Final = 40.0
+SPAN_DUST: Final = 60.0
+SPAN_SPEED: Final = 4.0
+SPAN_ALT: Final = 4.0
+
+
+def step(y, battery, prev_wind, prev_dust, speed, altitude, max_alt, r1, r2, r3):
+    # r1..r3 are uniform draws in [0, 1) scaled here to the original ranges.
+    y += altitude
+    y = max_alt if y > max_alt else 0.0 if y < 0.0 else y
+    speed_norm = speed * INV_SPEED_NORM
+    battery -= 1.5 * (speed_norm + 0.5 * y * INV_MAX_ALT + 0.1 + SPAN_DRAIN * r1)
+    battery = 0.0 if battery < 0.0 else battery
+    wind = prev_wind + (SPAN_WIND * r2 - 20.0) * (1.0 + speed_norm)
+    wind = 100.0 if wind > 100.0 else 40.0 if wind < 40.0 else wind
+    dust = prev_dust + (SPAN_DUST * r3 - 30.0) * (1.0 + wind * INV_WIND_NORM)
+    dust = 100.0 if dust > 100.0 else 40.0 if dust < 40.0 else dust
+    worst = dust if dust > wind else wind
+    sensor_code = int(worst > 60.0) + int(worst > 80.0)
+    return y, battery, wind, dust, sensor_code
+
+
+def env_recurrence(y0, prev_wind, prev_dust, speed, altitude, max_alt, r_wind, r_dust):
+    # Altitude clipping and wind/dust carry a step-to-step dependency, so they
+    # cannot be expressed with cumsum; run them as one scalar loop instead.
+    # Columns of the result are altitude, wind speed and dust level per step.
+    n = speed.shape[0]
+    out = np.empty((n, 3))
+    for i in range(n):
+        y0 += altitude[i]
+        y0 = max_alt if y0 > max_alt else 0.0 if y0 < 0.0 else y0
+        w = prev_wind + r_wind[i] * (1.0 + speed[i] * INV_SPEED_NORM)
+        prev_wind = 100.0 if w > 100.0 else 40.0 if w < 40.0 else w
+        d = prev_dust + r_dust[i] * (1.0 + prev_wind * INV_WIND_NORM)
+        prev_dust = 100.0 if d > 100.0 else 40.0 if d < 40.0 else d
+        out[i, 0] = y0
+        out[i, 1] = prev_wind
+        out[i, 2] = prev_dust
+    return out
@@ -0,0 +1,16 @@
+"""Ahead-of-time compile Falcon's trajectory recurrence into ``falcon_c``.
+
+Run ``python build_falcon.py`` once to produce the ``falcon_c`` extension
+next to Falcon.py. ``DroneClient.generate_telemetry_batch`` uses it when
+importable and falls back to the JIT/pure-Python kernel otherwise.
+"""
+from numba.pycc import CC
+
+from _falcon_kernels import env_recurrence
+
+cc = CC("falcon_c")
+cc.export("run_sim", "f8[:, :](f8, f8, f8, f8[:], f8[:], f8, f8[:], f8[:])")(env_recurrence)
+
+
+if __name__ == "__main__":
+    cc.compile()